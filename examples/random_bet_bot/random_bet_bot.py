@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
 from argparse import ArgumentParser
 from locale import LC_ALL, setlocale
@@ -102,6 +103,14 @@ async def print_win(match: Match):
             logger.info(f"You're out ${bet_amount}. Dang!")
 
 
+async def main():
+    # Python 3.12+: trigger handlers that never block finish inside gather()
+    # without a trip through the event loop.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    await client.run()
+
+
 if __name__ == "__main__":
 
     # Argparse
@@ -113,6 +122,9 @@ if __name__ == "__main__":
     parser.add_argument("--password", type=str, help="Saltybet.com Password")
     parser.add_argument("--max-bet", type=int, help="Maximum to randomly bet.")
     parser.add_argument("--min-bet", type=int, help="Minimum to randomly bet.")
+    parser.add_argument(
+        "--uvloop", action="store_true", help="Run on uvloop (must be installed)."
+    )
     args = parser.parse_args()
 
     # Logging Config
@@ -140,4 +152,4 @@ if __name__ == "__main__":
     client.on_status_locked(print_ratio)
     client.on_status_complete(print_win)
 
-    aiorun.run(client.run())
+    aiorun.run(main(), use_uvloop=args.uvloop)
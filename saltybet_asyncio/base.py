@@ -2,11 +2,11 @@
 
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, Optional, Tuple, Union
 
-import pendulum
-from aiohttp import ClientSession, TCPConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.web import HTTPUnauthorized
 from selectolax.parser import HTMLParser  # pylint: disable=no-name-in-module
 
@@ -23,6 +23,80 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional, both parsers take the response bytes directly.
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
+# Translation table for stripping thousands separators from bet totals.
+_DROP_COMMA = str.maketrans("", "", ",")
+
+# Seconds a confirmed login is trusted before checking the homepage again.
+_LOGIN_TTL = 30 * 60
+
+# Seconds a fetched homepage is reused by logged_in / balance.
+_HOME_TTL = 2.0
+
+# Team names carry this prefix, single fighters don't.
+_TEAM_PREFIX = "Team "
+
+# state.json / zdata.json status values.
+_STATUS_MAP = {
+    "open": MatchStatus.OPEN,
+    "locked": MatchStatus.LOCKED,
+    "1": MatchStatus.RED_WINS,
+    "2": MatchStatus.BLUE_WINS,
+}
+
+# state.json alerts announcing a game mode change.
+_ALERT_MODE = {
+    "Tournament mode start!": GameMode.TOURNAMENT,
+    "Exhibition mode start!": GameMode.EXHIBITION,
+}
+
+# state.json "remaining" text checks, tried in order.
+_REMAINING_MODE = (
+    (str.endswith, "in the bracket!", GameMode.TOURNAMENT),
+    (str.startswith, "FINAL ROUND!", GameMode.TOURNAMENT),
+    (str.endswith, "exhibition matches left!", GameMode.EXHIBITION),
+    (
+        str.startswith,
+        "Matchmaking mode will be activated after the next",
+        GameMode.EXHIBITION,
+    ),
+    (str.endswith, "next tournament!", GameMode.MATCHMAKING),
+    (
+        str.startswith,
+        "Tournament mode will be activated after the next",
+        GameMode.MATCHMAKING,
+    ),
+)
+
+# zdata.json keys describing the match rather than a bettor.
+_ZDATA_MATCH_KEYS = frozenset(
+    (
+        "p1name",
+        "p2name",
+        "p1total",
+        "p2total",
+        "status",
+        "alert",
+        "x",
+        "remaining",
+    )
+)
+
+# CSS Selectors
+_SEL_SIGN_IN = ".nav-text > a:nth-child(1) > span:nth-child(1)"
+_SEL_ILLUMINATI = ".navbar-text > span:nth-child(1)"
+_SEL_BALANCE = "#balance"
+
 
 class BasicClient:
     """Handles Saltybet Session Management and Basic Actions."""
@@ -33,165 +107,197 @@ class BasicClient:
 
         # Connections
         self.session: ClientSession = None
+        # Connection pool settings, applied when init() creates the session.
+        self.conn_limit: int = 100
+        self.conn_limit_per_host: int = 30
+        self.keepalive_timeout: float = 75
 
         # Credentials
         self.email: Optional[str] = None
         self.password: Optional[str] = None
 
+        # Limit Management, created in init() so it binds to the running loop.
+        self._login_lock: Optional[asyncio.Lock] = None
+
         # State
         self._logged_in: bool = False
-        self._last_login: pendulum.DateTime = pendulum.now().subtract(days=1)
-        self._illuminati: bool = False
+        self._logged_in_until: float = 0.0
+        # None until confirmed, membership doesn't change within a session.
+        self._illuminati: Optional[bool] = None
         self._match: Match = {"status": MatchStatus.UNKNOWN}
+        self._state_raw: Optional[bytes] = None
         self._matches_left: int = 0
+        self._home_cache: Optional[Tuple[float, HTMLParser]] = None
 
     # Async Init / Shutdown
 
     async def init(self):
         if not self.initialized:
+            if self._login_lock is None:
+                self._login_lock = asyncio.Lock()
             if self.session is None:
-                # Create aiohttp session
+                # Create aiohttp session, pooled connections are kept alive and
+                # DNS is cached so repeat requests skip the handshake.
                 self.session = ClientSession(
-                    connector=TCPConnector(limit=10, limit_per_host=5)
+                    connector=TCPConnector(
+                        limit=self.conn_limit,
+                        limit_per_host=self.conn_limit_per_host,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=self.keepalive_timeout,
+                    ),
+                    timeout=ClientTimeout(total=30),
                 )
             self.initialized = True
 
     async def shutdown(self):
-        logger.info("Closing HTTP Session.")
-        await self.session.close()
+        if self.session is not None and not self.session.closed:
+            logger.info("Closing HTTP Session.")
+            await self.session.close()
 
     # Login-related Async Properties
     @property
     async def logged_in(self) -> bool:
         if self.email is None or self.password is None:
             return False
-        elif self._last_login.diff(pendulum.now()).in_minutes() < 30:
+        elif time.monotonic() < self._logged_in_until:
             # Store logged in status for 30 minutes.
             return self._logged_in
-        logged_in = True
-        async with self.session.get("https://www.saltybet.com/") as resp:
-            if not resp.ok:
-                logger.error(f"Response code {resp.status} from {resp.url}.")
-                return False
-            html = await resp.read()
-            tree = HTMLParser(html)
-
-            # Check for lgoged in
-            for node in tree.css(".nav-text > a:nth-child(1) > span:nth-child(1)"):
-                if "Sign in" in node.text():
-                    logged_in = False
-                    break
-            # Check for illuminati
-            for node in tree.css(".navbar-text > span:nth-child(1)"):
-                if "goldtext" in node.attributes["class"]:
-                    self._illuminati = True
-                    break
+        tree = await self._home_tree()
+        if tree is None:
+            return False
+
+        # Check for lgoged in
+        node = tree.css_first(_SEL_SIGN_IN)
+        logged_in = node is None or "Sign in" not in node.text()
+        # Check for illuminati
+        node = tree.css_first(_SEL_ILLUMINATI)
+        illuminati = node is not None and "goldtext" in node.attributes.get("class", "")
         self._logged_in = logged_in
+        self._illuminati = illuminati if logged_in else None
+        if logged_in:
+            # Confirmed, skip checking again for the next 30 minutes.
+            self._logged_in_until = time.monotonic() + _LOGIN_TTL
         return logged_in
 
     @property
     async def illuminati(self) -> bool:
+        if self._illuminati is not None:
+            return self._illuminati
         if not await self.logged_in:
             logger.error("Illuminati status cannot be checked without being logged in.")
             return False
-        return self._illuminati
+        return bool(self._illuminati)
 
     # Private Actions
+    async def _home_tree(self) -> Optional[HTMLParser]:
+        """Fetches and parses the homepage, reused for a couple of seconds"""
+        now = time.monotonic()
+        if self._home_cache is not None and now - self._home_cache[0] < _HOME_TTL:
+            return self._home_cache[1]
+        async with self.session.get("https://www.saltybet.com/") as resp:
+            if not resp.ok:
+                logger.error("Response code %s from %s.", resp.status, resp.url)
+                return None
+            html = await resp.read()
+        tree = HTMLParser(html)
+        self._home_cache = (now, tree)
+        return tree
+
+    async def _require_illuminati(self, feature: str) -> bool:
+        """Logs in if needed and checks for illuminati membership"""
+        try:
+            await self._login()
+        except HTTPUnauthorized:
+            logger.error("%s only available when logged in.", feature)
+            return False
+        # _login() just confirmed the login, so the stored status is current.
+        if not self._illuminati:
+            logger.error("%s only available with illuminati membership.", feature)
+            return False
+        return True
+
+    def _expire_login(self):
+        """Drops the stored login / illuminati status so it is checked again"""
+        self._logged_in_until = 0.0
+        self._illuminati = None
+        # Otherwise the cached homepage would report the old status until its TTL.
+        self._home_cache = None
+
     async def _login(self):
         if self.email is None or self.password is None:
             logger.error("Login Failed, credentials not provided.")
             raise HTTPUnauthorized
-        if await self.logged_in:
-            return
-        data = {"email": self.email, "pword": self.password, "authenticate": "signin"}
-        await self.session.post(
-            "https://www.saltybet.com/authenticate?signin=1", data=data
-        )
-        if not await self.logged_in:
-            logger.error("Login Failed, check your credentials.")
-            raise HTTPUnauthorized
-        self._last_login = pendulum.now()
+        login_lock = self._login_lock
+        if login_lock is None:
+            raise RuntimeError("init() must be called before logging in.")
+        # Serialize logins so concurrent callers don't each post credentials.
+        async with login_lock:
+            if await self.logged_in:
+                return
+            data = {
+                "email": self.email,
+                "pword": self.password,
+                "authenticate": "signin",
+            }
+            await self.session.post(
+                "https://www.saltybet.com/authenticate?signin=1", data=data
+            )
+            # The cached homepage predates signing in.
+            self._home_cache = None
+            if not await self.logged_in:
+                logger.error("Login Failed, check your credentials.")
+                raise HTTPUnauthorized
 
     async def _get_raw_zdata_json(self) -> Optional[dict]:
         jresp: dict = {}
         async with self.session.get("https://www.saltybet.com/zdata.json") as resp:
-            html = await resp.read()
-            if html != "":
-                jresp = await resp.json(content_type="text/html")
-            else:
+            raw = await resp.read()
+            if not raw:
                 return None
+            jresp = _json_loads(raw)
         return jresp
 
     async def _get_raw_ajax_get_stats_php(self) -> Optional[dict]:
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Match stats only available when logged in.")
-            return None
-        if not await self.illuminati:
-            logger.error("Match stats only available with illuminati membership.")
+        if not await self._require_illuminati("Match stats"):
             return None
 
         jresp: dict = {}
         async with self.session.get(
             "https://www.saltybet.com/ajax_get_stats.php"
         ) as resp:
-            if not await resp.text():
+            raw = await resp.read()
+            if not raw:
                 return None
-            jresp = await resp.json(content_type="text/html")
+            jresp = _json_loads(raw)
         return jresp
 
-    async def _get_raw_state_json(self) -> dict:
-        state = {}
+    async def _get_raw_state(self) -> bytes:
         async with self.session.get("https://www.saltybet.com/state.json") as resp:
-            state = await resp.json(content_type="text/html")
-        return state
+            return await resp.read()
 
     # State Parsing
     def _status_to_MatchStatus(self, status: str) -> MatchStatus:
-        # Determine BettingStatus
-        out = MatchStatus.UNKNOWN
-        if status == "open":
-            out = MatchStatus.OPEN
-        elif status == "locked":
-            out = MatchStatus.LOCKED
-        elif status == "1":
-            out = MatchStatus.RED_WINS
-        elif status == "2":
-            out = MatchStatus.BLUE_WINS
-        else:
-            logger.warn(f"Unhandled status: {status}")
+        out = _STATUS_MAP.get(status)
+        if out is None:
+            logger.warning("Unhandled status: %s", status)
+            return MatchStatus.UNKNOWN
         return out
 
     def _alert_to_GameMode(self, alert: str) -> GameMode:
-        game_mode: GameMode = GameMode.UNKNOWN
         if alert == "":
-            return game_mode
-        elif alert == "Tournament mode start!":
-            game_mode = GameMode.TOURNAMENT
-        elif alert == "Exhibition mode start!":
-            game_mode = GameMode.EXHIBITION
-        else:
-            logger.warn(f"Unable to parse game mode from alert: {alert}")
+            return GameMode.UNKNOWN
+        game_mode = _ALERT_MODE.get(alert)
+        if game_mode is None:
+            logger.warning("Unable to parse game mode from alert: %s", alert)
+            return GameMode.UNKNOWN
         return game_mode
 
     def _remaining_to_GameMode(self, remaining: str) -> GameMode:
-        game_mode: GameMode = GameMode.UNKNOWN
-        if remaining.endswith("in the bracket!"):
-            game_mode = GameMode.TOURNAMENT
-        elif remaining.startswith("FINAL ROUND!"):
-            game_mode = GameMode.TOURNAMENT
-        elif remaining.endswith("exhibition matches left!"):
-            game_mode = GameMode.EXHIBITION
-        elif remaining.startswith("Matchmaking mode will be activated after the next"):
-            game_mode = GameMode.EXHIBITION
-        elif remaining.endswith("next tournament!"):
-            game_mode = GameMode.MATCHMAKING
-        elif remaining.startswith("Tournament mode will be activated after the next"):
-            game_mode = GameMode.MATCHMAKING
-        else:
-            logger.warn(f"Unable to parse game mode from remaining: {remaining}")
-        return game_mode
+        for matches, text, game_mode in _REMAINING_MODE:
+            if matches(remaining, text):
+                return game_mode
+        logger.warning("Unable to parse game mode from remaining: %s", remaining)
+        return GameMode.UNKNOWN
 
     def _parse_remaining_rounds(self, remaining: str) -> Optional[int]:
         until_next: Optional[int] = None
@@ -212,7 +318,7 @@ class BasicClient:
             if remaining.startswith(known_line):
                 until_next = 1
         if until_next is None:
-            logger.warn(f"Unable to parse remaining rounds from: {remaining}")
+            logger.warning("Unable to parse remaining rounds from: %s", remaining)
         return until_next
 
     # Async Properties
@@ -226,71 +332,63 @@ class BasicClient:
 
         balance = 0
 
-        async with self.session.get("https://www.saltybet.com/") as resp:
-            html = await resp.read()
-            if html is None:
-                logger.error("Failed to get balance.")
-                return 0
+        tree = await self._home_tree()
+        if tree is None:
+            logger.error("Failed to get balance.")
+            return 0
 
-            selector = "#balance"
-            for node in HTMLParser(html).css(selector):
-                balance = int(node.text().replace(",", ""))
+        node = tree.css_first(_SEL_BALANCE)
+        if node is not None:
+            balance = int(node.text().translate(_DROP_COMMA))
 
         return balance
 
     # Properties parsed from state.json
-    @property
-    async def match(self) -> Match:
-        if self._match["status"] == MatchStatus.UNKNOWN:
+    async def _ensure_state(self) -> Match:
+        """Returns the current Match, fetching state.json if it isn't known yet"""
+        if self._match["status"] is MatchStatus.UNKNOWN:
             await self.get_state()
         return self._match
 
+    @property
+    async def match(self) -> Match:
+        return await self._ensure_state()
+
     @property
     async def match_status(self) -> MatchStatus:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["status"]
+        return (await self._ensure_state())["status"]
 
     @property
     async def matches_remaining(self) -> int:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
+        await self._ensure_state()
         return self._matches_left
 
     @property
     async def game_mode(self) -> GameMode:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["mode"]
+        return (await self._ensure_state())["mode"]
 
     @property
     async def red_team_name(self) -> str:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["red_team_name"]
+        return (await self._ensure_state())["red_team_name"]
 
     @property
     async def blue_team_name(self) -> str:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["blue_team_name"]
+        return (await self._ensure_state())["blue_team_name"]
 
     @property
     async def red_bets(self) -> int:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["red_bets"]
+        return (await self._ensure_state())["red_bets"]
 
     @property
     async def blue_bets(self) -> int:
-        if self._match["status"] == MatchStatus.UNKNOWN:
-            await self.get_state()
-        return self._match["blue_bets"]
+        return (await self._ensure_state())["blue_bets"]
 
     # Public Actions
     async def login(self, email: str, password: str):
         self.email = email
         self.password = password
+        # New credentials, force the logged in status to be checked again.
+        self._expire_login()
         await self._login()
 
     async def place_bet(self, side: SideColor, wager: int):
@@ -319,40 +417,38 @@ class BasicClient:
             else:
                 logger.debug("Bet placed successfully")
 
-    async def _parse_bettor_items(self, k: str, v: dict) -> Optional[Bettor]:
-        if k in [
-            "p1name",
-            "p2name",
-            "p1total",
-            "p2total",
-            "status",
-            "alert",
-            "x",
-            "remaining",
-        ]:
+    def _parse_bettor_items(self, k: str, v: dict) -> Optional[Bettor]:
+        if k in _ZDATA_MATCH_KEYS:
             return None
-        elif "n" not in v or "b" not in v:
+        username = v.get("n")
+        balance = v.get("b")
+        if username is None or balance is None:
             return None
         bettor: Bettor = {
             "bettor_id": int(k),
-            "username": v["n"],
-            "balance": int(v["b"]),
+            "username": username,
+            "balance": int(balance),
         }
-        if "p" in v:
-            bettor["bet_side"] = SideColor(int(v["p"]))
-        if "w" in v:
-            bettor["wager"] = int(v["w"])
-        if "r" in v:
-            if len(v["r"]) > 3:
-                bettor["avatar"] = f"https://www.gravatar.com/avatar/{v['r']}"
+        side = v.get("p")
+        if side is not None:
+            bettor["bet_side"] = SideColor(int(side))
+        wager = v.get("w")
+        if wager is not None:
+            bettor["wager"] = int(wager)
+        rank = v.get("r")
+        if rank is not None:
+            if len(rank) > 3:
+                bettor["avatar"] = f"https://www.gravatar.com/avatar/{rank}"
             else:
                 bettor[
                     "avatar"
-                ] = f"https://www.saltybet.com/images/ranksmall/rank{v['r']}.png"
-        if "g" in v:
-            bettor["illuminati"] = v["g"] == "1"
-        if "c" in v and v["c"] != "0" and "," in v["c"]:
-            bettor["color_r"], bettor["color_g"], bettor["color_b"] = v["c"].split(",")
+                ] = f"https://www.saltybet.com/images/ranksmall/rank{rank}.png"
+        illuminati = v.get("g")
+        if illuminati is not None:
+            bettor["illuminati"] = illuminati == "1"
+        color = v.get("c")
+        if color is not None and color != "0" and "," in color:
+            bettor["color_r"], bettor["color_g"], bettor["color_b"] = color.split(",")
         return bettor
 
     async def get_bettors(self) -> Optional[Bettors]:
@@ -366,21 +462,19 @@ class BasicClient:
         }
         bettors["match"]["status"] = self._status_to_MatchStatus(jresp["status"])
         bettors["match"]["red_team_name"] = jresp["p1name"]
-        if not jresp["p1name"].startswith("Team "):
+        if not jresp["p1name"].startswith(_TEAM_PREFIX):
             red_fighter: Fighter = {"name": jresp["p1name"]}
             bettors["match"]["red_fighters"] = [red_fighter]
-        if not jresp["p2name"].startswith("Team "):
+        if not jresp["p2name"].startswith(_TEAM_PREFIX):
             blue_fighter: Fighter = {"name": jresp["p2name"]}
             bettors["match"]["blue_fighters"] = [blue_fighter]
         bettors["match"]["blue_team_name"] = jresp["p2name"]
-        bettors["match"]["red_bets"] = int(jresp["p1total"].replace(",", ""))
-        bettors["match"]["blue_bets"] = int(jresp["p2total"].replace(",", ""))
-        parsed_bettors = await asyncio.gather(
-            *[self._parse_bettor_items(k, v) for k, v in jresp.items()]
-        )
-        bettors["bettors"].extend(
-            [bettor for bettor in parsed_bettors if bettor is not None]
-        )
+        bettors["match"]["red_bets"] = int(jresp["p1total"].translate(_DROP_COMMA))
+        bettors["match"]["blue_bets"] = int(jresp["p2total"].translate(_DROP_COMMA))
+        for k, v in jresp.items():
+            bettor = self._parse_bettor_items(k, v)
+            if bettor is not None:
+                bettors["bettors"].append(bettor)
         return bettors
 
     async def get_match_stats(self) -> Optional[Match]:
@@ -453,9 +547,8 @@ class BasicClient:
         return stats
 
     # State Parsing
-    async def get_state(self) -> Match:
-        state = await self._get_raw_state_json()
-
+    def _parse_state(self, state: dict) -> Match:
+        """Parses a state.json payload into a Match"""
         match: Match = {}
 
         # MatchStatus
@@ -463,7 +556,7 @@ class BasicClient:
 
         # GameMode
         mode: GameMode = self._alert_to_GameMode(state["alert"])
-        if mode == GameMode.UNKNOWN:
+        if mode is GameMode.UNKNOWN:
             mode = self._remaining_to_GameMode(state["remaining"])
         match["mode"] = mode
 
@@ -474,20 +567,28 @@ class BasicClient:
 
         # Red Team
         p1name = state["p1name"]
-        if not p1name.startswith("Team "):
+        if not p1name.startswith(_TEAM_PREFIX):
             match["red_fighters"] = [{"name": p1name}]
         match["red_team_name"] = p1name
 
         # Blue Team
         p2name = state["p2name"]
-        if not p2name.startswith("Team "):
+        if not p2name.startswith(_TEAM_PREFIX):
             match["blue_fighters"] = [{"name": p2name}]
         match["blue_team_name"] = p2name
 
         # Bets
-        match["red_bets"] = int(state["p1total"].replace(",", ""))
-        match["blue_bets"] = int(state["p2total"].replace(",", ""))
+        match["red_bets"] = int(state["p1total"].translate(_DROP_COMMA))
+        match["blue_bets"] = int(state["p2total"].translate(_DROP_COMMA))
 
-        self._match = match
+        return match
 
+    async def get_state(self) -> Match:
+        raw = await self._get_raw_state()
+        if raw == self._state_raw:
+            # Same state.json as last time, the parsed match still applies.
+            return self._match
+        match = self._parse_state(_json_loads(raw))
+        self._match = match
+        self._state_raw = raw
         return match
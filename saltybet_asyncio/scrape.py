@@ -3,14 +3,16 @@
 import asyncio
 import logging
 import re
+import time
+from calendar import timegm
+from functools import lru_cache
+from html import unescape
 from random import random
-from typing import Generator, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-import pendulum
-from aiohttp.web import HTTPUnauthorized
-from selectolax.parser import HTMLParser  # pylint: disable=no-name-in-module
+from selectolax.parser import HTMLParser, Node  # pylint: disable=no-name-in-module
 
-from .base import BasicClient
+from .base import _TEAM_PREFIX, BasicClient
 from .types import (
     Fighter,
     GameMode,
@@ -24,114 +26,252 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# CSS Selectors
+_SEL_CONTENT = "#content"
+_SEL_LEADERBOARD_ROWS = ".leaderboard > tbody:nth-child(2) > tr"
+# The first link in the table body is the top row's tournament/match link.
+_SEL_TOP_LINK = ".leaderboard > tbody:nth-child(2) a[href]"
+_SEL_RESULT = "#result"
+_SEL_RESULT_TITLE = "#result > strong:nth-child(1)"
+_SEL_SPAN = "span"
+_SEL_TIERLIST = "#tierlist > li"
+_SEL_FIRST_LINK = "a:nth-child(1)"
+_SEL_STATNAME = ".statname"
+_SEL_LIFE = (
+    "table.detailedstats > tbody:nth-child(2) > tr:nth-child(2) > td:nth-child(1)"
+)
+_SEL_METER = (
+    "table.detailedstats > tbody:nth-child(2) > tr:nth-child(2) > td:nth-child(2)"
+)
+_SEL_AUTHOR = "#basicstats"
+_SEL_UPGRADES = "#compendiumright > div:nth-child(7)"
+
+# Title prefixes of non-tournament stats pages.
+_TAG_MODES = (
+    ("(Exhibitions)", GameMode.EXHIBITION),
+    ("(Matchmaking)", GameMode.MATCHMAKING),
+)
+_TOURNAMENT_TAG = "Tournament)"
+
+# Winner span classes on the stats pages.
+_CLASS_TO_STATUS = {
+    "redtext": MatchStatus.RED_WINS,
+    "bluetext": MatchStatus.BLUE_WINS,
+}
+
+# Upgrade dates are always in English, independent of the current locale.
+_MONTHS = {
+    month: number
+    for number, month in enumerate(
+        "January February March April May June July August September October "
+        "November December".split(),
+        start=1,
+    )
+}
+
+# Tournament leaderboard link text, e.g. "Red - $123, Blue - $456".
+# Fallback for _split_bets() when the plain splits don't fit.
+_TOURNAMENT_RE = re.compile(r"(.+) - \$(\d*), (.+) - \$(\d*)")
+
+# Fighter upgrade actions, e.g. "unlock on March 03, 2021" or "life +50".
+_UPGRADE_RE = re.compile(r"(unlock on|promote on|exhib meter [+-]|life [+-])\s*(.+)")
+_UPGRADE_TYPES = {
+    "unlock on": UpgradeType.UNLOCK,
+    "promote on": UpgradeType.PROMOTE,
+    "exhib meter +": UpgradeType.METER_INCREASE,
+    "exhib meter -": UpgradeType.METER_DECREASE,
+    "life +": UpgradeType.LIFE_INCREASE,
+    "life -": UpgradeType.LIFE_DECREASE,
+}
+_DATED_UPGRADES = frozenset((UpgradeType.UNLOCK, UpgradeType.PROMOTE))
+
+# Matches any HTML tag, used to strip markup from single upgrade lines.
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _split_bets(text: str) -> Optional[Tuple[str, str, str, str]]:
+    """Red name/bets and blue name/bets from a tournament leaderboard link"""
+    # The text is fixed-shape, plain splits avoid the backtracking regex.
+    try:
+        red, blue = text.rsplit(", ", 1)
+        red_team_name, red_bets = red.rsplit(" - $", 1)
+        blue_team_name, blue_bets = blue.rsplit(" - $", 1)
+    except ValueError:
+        pass
+    else:
+        if (not red_bets or red_bets.isdecimal()) and (
+            not blue_bets or blue_bets.isdecimal()
+        ):
+            return red_team_name, red_bets, blue_team_name, blue_bets
+    re_match = _TOURNAMENT_RE.match(text)
+    if re_match is None:
+        return None
+    red_team_name, red_bets, blue_team_name, blue_bets = re_match.groups()
+    return red_team_name, red_bets, blue_team_name, blue_bets
+
+
+def _backoff(factor: float, max_wait: float, attempt: int) -> float:
+    """Exponentially increasing wait with jitter, capped at max_wait"""
+    return min(max_wait, factor * (1 << attempt) + random())
+
+
+# Leaderboard rows are walked positionally rather than with per-row selectors.
+def _cells(row: Node) -> List[Node]:
+    """Element children of a table row, in column order"""
+    return list(row.iter(include_text=False))
+
+
+def _first_child(node: Node, tag: str) -> Optional[Node]:
+    """First element child of node if it is a <tag>, like tag:nth-child(1)"""
+    for child in node.iter(include_text=False):
+        return child if child.tag == tag else None
+    return None
+
+
+def _parse_tournament_row(
+    row: Node, tournament_id: int, mode: GameMode
+) -> Optional[Match]:
+    """Match from a tournament leaderboard row, None if it has no match link"""
+    cells = _cells(row)
+    row_a = _first_child(cells[0], "a") if cells else None
+    if row_a is None:
+        return None
+
+    match: Match = {
+        "mode": mode,
+        "status": MatchStatus.UNKNOWN,
+        "tournament_id": tournament_id,
+        "match_id": int(row_a.attrs["href"].rpartition("=")[2]),
+        "red_fighters": [],
+        "blue_fighters": [],
+        "red_bets": 0,
+        "blue_bets": 0,
+    }
+
+    bets = _split_bets(row_a.text())
+    if bets:
+        red_team_name, red_bets, blue_team_name, blue_bets = bets
+        red_team_name = red_team_name.strip()
+        match["red_team_name"] = red_team_name
+        if not red_team_name.startswith(_TEAM_PREFIX):
+            match["red_fighters"] = [{"name": red_team_name}]
+        if red_bets:
+            match["red_bets"] = int(red_bets)
+        blue_team_name = blue_team_name.strip()
+        match["blue_team_name"] = blue_team_name
+        if not blue_team_name.startswith(_TEAM_PREFIX):
+            match["blue_fighters"] = [{"name": blue_team_name}]
+        if blue_bets:
+            match["blue_bets"] = int(blue_bets)
+
+    row_span = _first_child(cells[1], "span") if len(cells) > 1 else None
+    if row_span is None:
+        match["status"] = MatchStatus.DRAW
+    else:
+        match["status"] = _CLASS_TO_STATUS.get(
+            row_span.attributes.get("class"), MatchStatus.UNKNOWN
+        )
+    return match
+
 
 class ScraperClient(BasicClient):
     def __init__(self):
-        # Limit Management
-        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(1)
-        self._last_req: pendulum.DateTime = pendulum.now().subtract(minutes=1)
-
-        # Regex
-        self._tournament_regex = re.compile(r"(.+) - \$(\d*), (.+) - \$(\d*)")
+        # Limit Management, the lock is created in init() on the running loop.
+        self._scrape_lock: Optional[asyncio.Lock] = None
+        self._last_req: float = time.monotonic() - 60
 
         # Parent __init__()
         super().__init__()
 
     async def init(self):
         if not self.initialized:
-            if self._semaphore is None:
+            if self._scrape_lock is None:
                 # Initialize again to ensure we're on the same loop.
-                self._semaphore = asyncio.Semaphore(1)
+                self._scrape_lock = asyncio.Lock()
 
         # Parent init()
         await super().init()
 
-    # Generates exponentially increasing wait times
-    def _wait_generator(
-        self, factor: float = 1, max_wait: float = 512.0
-    ) -> Generator[float, None, None]:
-        n = 0
-        while True:
-            a = (factor * (2 ** n)) + random()
-            if a <= max_wait:
-                yield a
-                n += 1
-            else:
-                yield max_wait
-
-    async def _get_html(self, url: str, max_retries: int = 10) -> Optional[bytes]:
-        """HTTP GET Request with limit message check.
+    async def _get_tree(self, url: str, max_retries: int = 10) -> Optional[HTMLParser]:
+        """HTTP GET Request with limit message check, returning the parsed page.
         Only used for scraping and illuminati-required stats."""
         out = None
-        normal_wait_gen = self._wait_generator(factor=7.0, max_wait=90.0)
-        limit_wait_gen = self._wait_generator(factor=90.0, max_wait=300.0)
-        async with self._semaphore:
-            logger.debug(f"Attempting to get {url} without hitting limit...")
+        limit_hits = 0
+        scrape_lock = self._scrape_lock
+        if scrape_lock is None:
+            raise RuntimeError("init() must be called before scraping.")
+        async with scrape_lock:
+            logger.debug("Attempting to get %s without hitting limit...", url)
             for i in range(max_retries):
                 # Delay between each request
-                since_last_req = pendulum.now().diff(self._last_req).in_seconds()
-                logger.debug(f"{since_last_req} seconds since last request")
-                wait = next(normal_wait_gen)
+                since_last_req = time.monotonic() - self._last_req
+                logger.debug("%.2f seconds since last request", since_last_req)
+                wait = _backoff(7.0, 90.0, i)
                 if since_last_req < wait:
                     wait_secs = wait - since_last_req
-                    logger.debug(f"Waiting {wait_secs} seconds before next request...")
+                    logger.debug(
+                        "Waiting %.2f seconds before next request...", wait_secs
+                    )
                     await asyncio.sleep(wait_secs)
 
                 async with self.session.get(url) as resp:
-                    self._last_req = pendulum.now()
+                    self._last_req = time.monotonic()
                     if not resp.ok:
-                        logger.error(f"Response code {resp.status} from {resp.url}.")
+                        logger.error("Response code %s from %s.", resp.status, resp.url)
+                        if resp.status in (401, 403):
+                            # Session expired early, don't trust the stored status.
+                            self._expire_login()
                         break
 
                     html = await resp.read()
 
-                    # Check for limit reached message.
-                    content = HTMLParser(html).css_first("#content")
-                    if (
-                        content is not None
-                        and "The maximum number of stats requests has been reached."
-                        in content.text(deep=False)
-                    ):
-                        wait_after_limit = next(limit_wait_gen)
-                        logger.info(f"Maximum requests hit on attempt {i}.")
-                        logger.info(
-                            f"Waiting {wait_after_limit} seconds before retrying..."
-                        )
-                        await asyncio.sleep(wait_after_limit)
-                        continue
-
-                    out = html
-                    break
+                # Parsed once here, callers reuse the tree.
+                tree = await self._parse_html(html)
+
+                # Check for limit reached message.
+                content = tree.css_first(_SEL_CONTENT)
+                if (
+                    content is not None
+                    and "The maximum number of stats requests has been reached."
+                    in content.text(deep=False)
+                ):
+                    wait_after_limit = _backoff(90.0, 300.0, limit_hits)
+                    limit_hits += 1
+                    logger.info("Maximum requests hit on attempt %s.", i)
+                    logger.info(
+                        "Waiting %s seconds before retrying...", wait_after_limit
+                    )
+                    await asyncio.sleep(wait_after_limit)
+                    continue
+
+                out = tree
+                break
         return out
 
+    async def _parse_html(self, html: bytes) -> HTMLParser:
+        """Builds the DOM in the default executor, keeping the event loop free
+        for websocket traffic while large stats pages are parsed."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, HTMLParser, html)
+
     # Tournament/Match ID Scraping
     async def _get_tournament_id(self) -> Optional[int]:
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Tournament ID only available when logged in.")
-            return None
-
-        if not await self.illuminati:
-            logger.error("Tournament ID only available with illuminati membership.")
+        if not await self._require_illuminati("Tournament ID"):
             return None
 
-        html = await self._get_html(
+        tree = await self._get_tree(
             "https://www.saltybet.com/stats?tournamentstats=1&page=1"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to get Tournament ID")
             return None
 
-        top_result_node = HTMLParser(html).css_first(
-            ".leaderboard > tbody:nth-child(2) > tr:nth-child(1) > "
-            + "td:nth-child(1) > a:nth-child(1)"
-        )
+        top_result_node = tree.css_first(_SEL_TOP_LINK)
         if top_result_node is None:
             logger.error("Failed to get Tournament ID")
             return None
         link = top_result_node.attrs["href"]
-        tournament_id = int(link.split("=")[-1])
+        tournament_id = int(link.rpartition("=")[2])
         return tournament_id
 
     async def _get_match_id(self, tournament_id: int = None) -> Optional[int]:
@@ -139,23 +279,19 @@ class ScraperClient(BasicClient):
         if tournament_id is None:
             return None
 
-        html = await self._get_html(
+        tree = await self._get_tree(
             f"https://www.saltybet.com/stats?tournament_id={tournament_id}"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to get Match ID")
             return None
 
-        tree = HTMLParser(html)
-        top_row = tree.css_first(
-            ".leaderboard > tbody:nth-child(2) > tr:nth-child(1) > "
-            + "td:nth-child(1) > a:nth-child(1)"
-        )
+        top_row = tree.css_first(_SEL_TOP_LINK)
         if top_row is None:
             logger.error("Failed to get Match ID")
             return None
         match_link = top_row.attrs["href"]
-        match_id = match_link.split("=")[1]
+        match_id = int(match_link.rpartition("=")[2])
         return match_id
 
     async def _get_tournament_and_match_id(self) -> Tuple[Optional[int], Optional[int]]:
@@ -174,34 +310,24 @@ class ScraperClient(BasicClient):
         _, match_id = await self._get_tournament_and_match_id()
         return match_id
 
-    def _split_tournament_name_and_mode(
-        self, tournament_name: str
-    ) -> Tuple[GameMode, str]:
-        EXHIBITIONS_TAG = "(Exhibitions)"
-        MATCHMAKING_TAG = "(Matchmaking)"
-        tournament_title = ""
-        tournament_mode = GameMode.UNKNOWN
-        if tournament_name.startswith(EXHIBITIONS_TAG):
-            tournament_mode = GameMode.EXHIBITION
-            tournament_title = tournament_name.replace(EXHIBITIONS_TAG, "").lstrip()
-        elif tournament_name.startswith(MATCHMAKING_TAG):
-            tournament_mode = GameMode.MATCHMAKING
-            tournament_title = tournament_name.replace(MATCHMAKING_TAG, "").lstrip()
-        else:
-            tournament_mode = GameMode.TOURNAMENT
-            tournament_title = tournament_name.split("Tournament)")[1].lstrip()
-        return tournament_mode, tournament_title
+    def _parse_upgrade_date(self, date: str) -> int:
+        """Converts an upgrade date like "January 02, 2021" to a UTC timestamp."""
+        month, day, year = date.replace(",", "").split()
+        return timegm((int(year), _MONTHS[month], int(day), 0, 0, 0))
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _split_tournament_name_and_mode(tournament_name: str) -> Tuple[GameMode, str]:
+        # Slice past the known tag rather than replace/split the whole name.
+        for tag, tournament_mode in _TAG_MODES:
+            if tournament_name.startswith(tag):
+                return tournament_mode, tournament_name[len(tag) :].lstrip()
+        start = tournament_name.find(_TOURNAMENT_TAG)
+        start = start + len(_TOURNAMENT_TAG) if start != -1 else 0
+        return GameMode.TOURNAMENT, tournament_name[start:].lstrip()
 
     async def scrape_tournament(self, tournament_id: int) -> Optional[Tournament]:
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Tournament scraping only available when logged in.")
-            return None
-        if not await self.illuminati:
-            logger.error(
-                "Tournament scraping only available with illuminati membership."
-            )
+        if not await self._require_illuminati("Tournament scraping"):
             return None
 
         tournament: Tournament = {
@@ -209,21 +335,20 @@ class ScraperClient(BasicClient):
             "mode": GameMode.UNKNOWN,
             "matches": [],
         }
-        html = await self._get_html(
+        tree = await self._get_tree(
             f"https://www.saltybet.com/stats?tournament_id={tournament_id}"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to scrape Tournament")
             return None
-        tree = HTMLParser(html)
 
         # Determine if empty
-        rows = tree.css(".leaderboard > tbody:nth-child(2) > tr")
+        rows = tree.css(_SEL_LEADERBOARD_ROWS)
         if not rows:
             return None
 
         # Name and Mode
-        tournament_name = tree.css_first("#result > strong:nth-child(1)").text()
+        tournament_name = tree.css_first(_SEL_RESULT_TITLE).text()
         tournament["mode"], tournament["name"] = self._split_tournament_name_and_mode(
             tournament_name
         )
@@ -232,67 +357,49 @@ class ScraperClient(BasicClient):
         if tournament["mode"] == GameMode.UNKNOWN:
             return None
 
-        # Matches
+        # Matches, loop invariants bound once.
+        mode = tournament["mode"]
+        add_match = tournament["matches"].append
         for row in rows:
-            match: Match = {
-                "mode": GameMode.UNKNOWN,
-                "status": MatchStatus.UNKNOWN,
-                "tournament_id": tournament_id,
-                "red_fighters": [],
-                "blue_fighters": [],
-                "red_bets": 0,
-                "blue_bets": 0,
-            }
-
-            row_a = row.css_first("td:nth-child(1) > a:nth-child(1)")
-            match["match_id"] = row_a.attrs["href"].split("=")[1]
-            match["mode"] = tournament["mode"]
-
-            re_match = self._tournament_regex.match(row_a.text())
-            if re_match:
-                red_team_name, red_bets, blue_team_name, blue_bets = re_match.groups()
-                match["red_team_name"] = red_team_name.strip()
-                if not match["red_team_name"].startswith("Team "):
-                    match["red_fighters"] = [{"name": match["red_team_name"]}]
-                if red_bets != "":
-                    match["red_bets"] = int(red_bets)
-                match["blue_team_name"] = blue_team_name.strip()
-                if not match["blue_team_name"].startswith("Team "):
-                    match["blue_fighters"] = [{"name": match["blue_team_name"]}]
-                if blue_bets != "":
-                    match["blue_bets"] = int(blue_bets)
-
-            row_span = row.css_first("td:nth-child(2) > span:nth-child(1)")
-            if row_span is None:
-                match["status"] = MatchStatus.DRAW
-            elif row_span.attrs["class"] == "redtext":
-                match["status"] = MatchStatus.RED_WINS
-            elif row_span.attrs["class"] == "bluetext":
-                match["status"] = MatchStatus.BLUE_WINS
-
-            tournament["matches"].append(match)
+            match = _parse_tournament_row(row, tournament_id, mode)
+            if match is None:
+                logger.warning("Skipping malformed row in Tournament %d", tournament_id)
+                continue
+            add_match(match)
         return tournament
 
-    async def scrape_match(self, tournament_id: int, match_id: int) -> Optional[Match]:
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Match scraping only available when logged in.")
+    async def scrape_tournament_full(self, tournament_id: int) -> Optional[Tournament]:
+        """Scrapes a tournament along with the stats page of each of its matches"""
+        tournament = await self.scrape_tournament(tournament_id)
+        if tournament is None:
             return None
-        if not await self.illuminati:
-            logger.error("Match scraping only available with illuminati membership.")
+        # Requests still go out one at a time behind the scrape lock, the
+        # stats pages are rate limited.
+        scraped = await asyncio.gather(
+            *(
+                self.scrape_match(tournament_id, match["match_id"])
+                for match in tournament["matches"]
+            )
+        )
+        # Keep the leaderboard row for any match that failed to scrape.
+        tournament["matches"] = [
+            full or row for full, row in zip(scraped, tournament["matches"])
+        ]
+        return tournament
+
+    async def scrape_match(self, tournament_id: int, match_id: int) -> Optional[Match]:
+        if not await self._require_illuminati("Match scraping"):
             return None
 
-        html = await self._get_html(
+        tree = await self._get_tree(
             f"https://www.saltybet.com/stats?match_id={match_id}"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to scrape Match")
             return None
-        tree = HTMLParser(html)
 
         # Determine if Empty
-        rows = tree.css(".leaderboard > tbody:nth-child(2) > tr")
+        rows = tree.css(_SEL_LEADERBOARD_ROWS)
         if not rows:
             logger.error("Failed to scrape Match")
             return None
@@ -306,64 +413,63 @@ class ScraperClient(BasicClient):
             "blue_bets": 0,
         }
 
-        result_node = tree.css_first("#result")
+        result_node = tree.css_first(_SEL_RESULT)
         # Winner
-        winner_class = result_node.css_first("span").attrs["class"]
-        if "redtext" in winner_class:
-            match["status"] = MatchStatus.RED_WINS
-        elif "bluetext" in winner_class:
-            match["status"] = MatchStatus.BLUE_WINS
+        winner_class = result_node.css_first(_SEL_SPAN).attrs["class"]
+        match["status"] = _CLASS_TO_STATUS.get(winner_class, MatchStatus.UNKNOWN)
 
         # Title / Fighters
         title = result_node.text(deep=False).strip().replace("Winner:", "")
         red_team, remaining_title = title.split(" vs ")
         match["red_team_name"] = red_team
-        if not red_team.startswith("Team "):
+        if not red_team.startswith(_TEAM_PREFIX):
             match["red_fighters"] = [{"name": red_team}]
         blue_team, remaining_title = remaining_title.split(" at ")
         match["blue_team_name"] = blue_team
-        if not blue_team.startswith("Team "):
+        if not blue_team.startswith(_TEAM_PREFIX):
             match["blue_fighters"] = [{"name": blue_team}]
         match["mode"], _ = self._split_tournament_name_and_mode(remaining_title)
 
         # Bets
+        red_bets = 0
+        blue_bets = 0
         for row in rows:
-            bet_placed_node = row.css_first("td:nth-child(2)")
-            amount = int(bet_placed_node.text().split(" on ")[0])
-            color_class = bet_placed_node.css_first("span:nth-child(1)").attrs["class"]
-            if "redtext" in color_class:
-                match["red_bets"] += amount
-            elif "bluetext" in color_class:
-                match["blue_bets"] += amount
+            bet_placed_node = _cells(row)[1]
+            bet_span = _first_child(bet_placed_node, "span")
+            if bet_span is None:
+                logger.warning("Skipping bet row without a team in Match %d", match_id)
+                continue
+            amount = int(bet_placed_node.text().partition(" on ")[0])
+            # The span carries a single color class, compare it whole.
+            color_class = bet_span.attributes.get("class")
+            if color_class == "redtext":
+                red_bets += amount
+            elif color_class == "bluetext":
+                blue_bets += amount
+        match["red_bets"] = red_bets
+        match["blue_bets"] = blue_bets
         return match
 
     async def scrape_compendium(self, tier: Tier) -> Optional[List[Fighter]]:
         fighters: List[Fighter] = []
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Compendium scraping only available when logged in.")
-            return None
-        if not await self.illuminati:
-            logger.error(
-                "Compendium scraping only available with illuminati membership."
-            )
+        if not await self._require_illuminati("Compendium scraping"):
             return None
 
-        html = await self._get_html(
+        tree = await self._get_tree(
             f"https://www.saltybet.com/compendium?tier={tier.value}"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to scrape Compendium")
             return None
-        tree = HTMLParser(html)
-        rows = tree.css("#tierlist > li")
+        rows = tree.css(_SEL_TIERLIST)
         if not rows:
             logger.error("Failed to scrape Compendium")
             return None
 
         for row in rows:
-            fighter_id = row.css_first("a:nth-child(1)").attrs["href"].split("=")[-1]
+            fighter_id = int(
+                row.css_first(_SEL_FIRST_LINK).attrs["href"].rpartition("=")[2]
+            )
             fighters.append(
                 {"name": row.text(), "fighter_id": fighter_id, "tier": tier}
             )
@@ -371,56 +477,35 @@ class ScraperClient(BasicClient):
 
     async def scrape_fighter(self, tier: Tier, fighter_id: int) -> Optional[Fighter]:
         fighter: Fighter = {}
-        try:
-            await self._login()
-        except HTTPUnauthorized:
-            logger.error("Compendium scraping only available when logged in.")
-            return None
-        if not await self.illuminati:
-            logger.error(
-                "Compendium scraping only available with illuminati membership."
-            )
+        if not await self._require_illuminati("Compendium scraping"):
             return None
 
-        html = await self._get_html(
+        tree = await self._get_tree(
             f"https://www.saltybet.com/compendium?tier={tier.value}"
             + f"&character={fighter_id}"
         )
-        if html is None:
+        if tree is None:
             logger.error("Failed to scrape Fighter")
             return None
 
-        tree = HTMLParser(html)
         fighter = {
-            "name": tree.css_first(".statname").text(deep=False).strip(),
+            "name": tree.css_first(_SEL_STATNAME).text(deep=False).strip(),
             "fighter_id": fighter_id,
             "tier": tier,
-            "life": int(
-                tree.css_first(
-                    "table.detailedstats > tbody:nth-child(2) > "
-                    + "tr:nth-child(2) > td:nth-child(1)"
-                ).text()
-            ),
-            "meter": int(
-                tree.css_first(
-                    "table.detailedstats > tbody:nth-child(2) > "
-                    + "tr:nth-child(2) > td:nth-child(2)"
-                ).text()
-            ),
+            "life": int(tree.css_first(_SEL_LIFE).text()),
+            "meter": int(tree.css_first(_SEL_METER).text()),
             "sprite": f"https://www.saltybet.com/images/charanim/{fighter_id}.gif",
             "upgrades": [],
         }
 
-        author = (
-            tree.css_first("#basicstats").text(deep=False).strip().replace("by ", "")
-        )
+        author = tree.css_first(_SEL_AUTHOR).text(deep=False).strip().replace("by ", "")
         if author != "":
             fighter["author"] = author
 
-        upgrades_block = tree.css_first("#compendiumright > div:nth-child(7)")
+        upgrades_block = tree.css_first(_SEL_UPGRADES)
         if upgrades_block is not None:
             for html_line in upgrades_block.html.split("<br>"):
-                line = HTMLParser(html_line).text()
+                line = unescape(_TAG_RE.sub("", html_line)).strip()
                 if ":" not in line:
                     continue
                 upgrade: Upgrade = {
@@ -428,29 +513,28 @@ class ScraperClient(BasicClient):
                     "upgrade_type": UpgradeType.UNKNOWN,
                     "value": 0,
                 }
-                upgrade["username"], action = line.split(":")
-                if "unlock" in action or "promote" in action:
-                    if "unlock" in action:
-                        action = action.replace("unlock on", "").strip()
-                        upgrade["upgrade_type"] = UpgradeType.UNLOCK
+                upgrade["username"], _, action = line.partition(":")
+                re_match = _UPGRADE_RE.search(action)
+                if re_match:
+                    kind, value = re_match.groups()
+                    upgrade["upgrade_type"] = _UPGRADE_TYPES[kind]
+                    if upgrade["upgrade_type"] in _DATED_UPGRADES:
+                        upgrade["value"] = self._parse_upgrade_date(value)
                     else:
-                        action = action.replace("promote on", "").strip()
-                        upgrade["upgrade_type"] = UpgradeType.PROMOTE
-                    upgrade["value"] = int(
-                        pendulum.from_format(action, "MMMM DD, YYYY").format("X")
-                    )
-                elif "exhib meter +" in action:
-                    upgrade["upgrade_type"] = UpgradeType.METER_INCREASE
-                    upgrade["value"] = int(action.replace("exhib meter +", "").strip())
-                elif "exhib meter -" in action:
-                    upgrade["upgrade_type"] = UpgradeType.METER_DECREASE
-                    upgrade["value"] = int(action.replace("exhib meter -", "").strip())
-                elif "life +" in action:
-                    upgrade["upgrade_type"] = UpgradeType.LIFE_INCREASE
-                    upgrade["value"] = int(action.replace("life +", "").strip())
-                elif "life -" in action:
-                    upgrade["upgrade_type"] = UpgradeType.LIFE_DECREASE
-                    upgrade["value"] = int(action.replace("life -", "").strip())
+                        upgrade["value"] = int(value)
                 fighter["upgrades"].append(upgrade)
 
         return fighter
+
+    async def scrape_tier_fighters(self, tier: Tier) -> Optional[List[Fighter]]:
+        """Scrapes the compendium of a tier along with each fighter's page"""
+        fighters = await self.scrape_compendium(tier)
+        if fighters is None:
+            return None
+        # Requests still go out one at a time behind the scrape lock, each page
+        # is picked apart while the next request waits out the rate limit.
+        scraped = await asyncio.gather(
+            *(self.scrape_fighter(tier, fighter["fighter_id"]) for fighter in fighters)
+        )
+        # Keep the compendium entry for any fighter that failed to scrape.
+        return [full or entry for full, entry in zip(scraped, fighters)]
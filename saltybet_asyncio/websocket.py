@@ -2,16 +2,99 @@
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from typing import List
+from functools import partialmethod
+from random import random
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+from aiohttp import ClientError
 from socketio import AsyncClient
+from socketio.exceptions import ConnectionError as SocketIOConnectionError
 
-from .base import BasicClient
-from .types import GameMode, Match, MatchStatus
+from .base import _TEAM_PREFIX, BasicClient
+from .types import Fighter, GameMode, Match, MatchStatus
 
 logger = logging.getLogger(__name__)
 
+SALTYBET_WS_URL = "https://www.saltybet.com:2096"
+
+# Trigger names, as used by the on_* registrars and remove_trigger().
+_TRIGGER_NAMES = (
+    "on_start",
+    "on_end",
+    "on_status_change",
+    "on_status_open",
+    "on_status_locked",
+    "on_status_complete",
+    "on_mode_change",
+    "on_mode_tournament",
+    "on_mode_exhibition",
+    "on_mode_matchmaking",
+)
+
+# Status / mode specific triggers, fired alongside on_status/mode_change.
+_STATUS_TRIGGER = {
+    MatchStatus.OPEN: "on_status_open",
+    MatchStatus.LOCKED: "on_status_locked",
+    MatchStatus.RED_WINS: "on_status_complete",
+    MatchStatus.BLUE_WINS: "on_status_complete",
+    MatchStatus.DRAW: "on_status_complete",
+}
+_MODE_TRIGGER = {
+    GameMode.TOURNAMENT: "on_mode_tournament",
+    GameMode.EXHIBITION: "on_mode_exhibition",
+    GameMode.MATCHMAKING: "on_mode_matchmaking",
+}
+
+
+class _OrjsonCodec:
+    """Stand-in for the json module so socket.io packets go through orjson"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        # orjson output is already compact, separators etc. are ignored.
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+# orjson is optional, None keeps python-socketio's default json module.
+_SIO_JSON: Optional[type]
+try:
+    import orjson
+except ImportError:
+    _SIO_JSON = None
+else:
+    _SIO_JSON = _OrjsonCodec
+
+# Ordered sets of handlers, dicts keep registration order with O(1) lookups.
+_Trigger = Callable[..., Awaitable[None]]
+_Triggers = Dict[_Trigger, None]
+_MatchDispatch = Tuple[Callable[[Match], Awaitable[None]], ...]
+_GameModeDispatch = Tuple[Callable[[GameMode], Awaitable[None]], ...]
+
+
+def _stats_side_matches(team_name: str, fighters: List[Fighter]) -> bool:
+    """Whether stats fighters belong to a state.json side"""
+    # "Team X" names don't list their fighters, so they can't be checked.
+    if team_name.startswith(_TEAM_PREFIX):
+        return True
+    return " / ".join(fighter["name"] for fighter in fighters) == team_name
+
+
+def _stats_match_teams(stats: Match, teams: Tuple[str, str]) -> bool:
+    """Whether stats describe the matchup of the given state.json team names"""
+    red_team_name, blue_team_name = teams
+    red_ok = _stats_side_matches(red_team_name, stats["red_fighters"])
+    return red_ok and _stats_side_matches(blue_team_name, stats["blue_fighters"])
+
+
+def _log_errors(trigger: str, results: Iterable[object]):
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error in %s trigger.", trigger, exc_info=result)
+
 
 class WebsocketClient(BasicClient):
     def __init__(self):
@@ -19,79 +102,205 @@ class WebsocketClient(BasicClient):
         self.running: bool = False
         self._last_match_status: MatchStatus = MatchStatus.UNKNOWN
         self._last_game_mode: GameMode = GameMode.UNKNOWN
+        self._match_stats: Optional[Match] = None
+        self._match_stats_teams: Tuple[str, str] = ("", "")
 
         # Connections
         self.sio: AsyncClient = None
-
-        # Triggers
-        # Start / End
-        self._on_start_triggers: List[Callable[[], Awaitable[None]]] = []
-        self._on_end_triggers: List[Callable[[], Awaitable[None]]] = []
-        # MatchStatus Change
-        self._on_status_change_triggers: List[Callable[[Match], Awaitable[None]]] = []
-        self._on_status_open_triggers: List[Callable[[Match], Awaitable[None]]] = []
-        self._on_status_locked_triggers: List[Callable[[Match], Awaitable[None]]] = []
-        self._on_status_complete_triggers: List[Callable[[Match], Awaitable[None]]] = []
-        # GameMode Change
-        self._on_mode_change_triggers: List[Callable[[GameMode], Awaitable[None]]] = []
-        self._on_mode_tournament_triggers: List[
-            Callable[[GameMode], Awaitable[None]]
-        ] = []
-        self._on_mode_exhibition_triggers: List[
-            Callable[[GameMode], Awaitable[None]]
-        ] = []
-        self._on_mode_matchmaking_triggers: List[
-            Callable[[GameMode], Awaitable[None]]
-        ] = []
+        self.ws_url: str = SALTYBET_WS_URL
+        # Reconnect backoff, doubling from the base delay up to the max, with
+        # +/- jitter (a fraction of each delay) so clients don't reconnect in
+        # lockstep. The library's own reconnects read these once in init() and
+        # only take jitter in seconds, so they get the fraction of the base delay.
+        self.reconnect_delay: float = 1.0
+        self.reconnect_delay_max: float = 600.0
+        self.reconnect_jitter: float = 0.2
+        # Pending state refreshes, bursts of messages collapse into one.
+        self._message_queue: Optional[asyncio.Queue] = None
+        self._message_consumer: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+        # Triggers, keyed by trigger name
+        self._triggers: Dict[str, _Triggers] = {name: {} for name in _TRIGGER_NAMES}
+        # Handlers to fire per status / mode, rebuilt after (un)registration.
+        self._status_dispatch: Dict[MatchStatus, _MatchDispatch] = {}
+        self._mode_dispatch: Dict[GameMode, _GameModeDispatch] = {}
+        # Run handlers in background tasks so slow ones don't hold up the next
+        # state refresh. Handlers for consecutive states may then overlap.
+        self.concurrent_handlers: bool = False
+        self._handler_tasks: Set[asyncio.Task] = set()
 
         # Parent __init__()
         super().__init__()
 
     async def init(self):
-        if not self.initialized:
-            if self.sio is None:
-                # SocketIO Client
-                self.sio = AsyncClient()
-                # Register Websocket Handler
-                self.sio.on("message", self._on_message)
-
-            # On_Start Event
-            for f in self._on_start_triggers:
-                await f()
+        starting = not self.initialized
+        if starting and self.sio is None:
+            # SocketIO Client, dropped connections are retried by the library.
+            self.sio = AsyncClient(
+                reconnection=True,
+                reconnection_attempts=0,
+                reconnection_delay=self.reconnect_delay,
+                reconnection_delay_max=self.reconnect_delay_max,
+                randomization_factor=self.reconnect_jitter * self.reconnect_delay,
+                json=_SIO_JSON,
+            )
+            # Register Websocket Handler
+            self.sio.on("message", self._queue_message)
 
         # Parent init()
         await super().init()
 
+        if starting:
+            # On_Start Event, fired once the HTTP session exists.
+            await self._trigger_lifecycle("on_start")
+
     async def run(self):
         await self.init()
         self.running = True
+        self._message_queue = asyncio.Queue(maxsize=1)
+        self._message_consumer = asyncio.create_task(self._consume_messages())
 
         # Listen for Events
-        logger.info("Connecting to saltybet websocket...")
-        await self.sio.connect("https://www.saltybet.com:2096")
-        logger.info("Connected, waiting for messages.")
-        while True:
+        stop = self._stop_event = asyncio.Event()
+        attempt: Optional[int] = 0
+        try:
+            while attempt is not None:
+                attempt = await self._connect_or_backoff(stop, attempt)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            # run() owns the consumer, stop it before the session goes away.
+            consumer = self._message_consumer
+            consumer.cancel()
+            await asyncio.gather(consumer, return_exceptions=True)
+            # Shielded so a second cancellation can't cut cleanup short.
+            await asyncio.shield(self.shutdown())
+
+    async def _connect_or_backoff(
+        self, stop: asyncio.Event, attempt: int
+    ) -> Optional[int]:
+        """Connects if needed and waits for the connection to end, returning the
+        next reconnect attempt, or None once stop() was called"""
+        sio = self.sio
+        if stop.is_set():
+            return None
+        if not sio.connected:
             try:
-                await self.sio.wait()
-            except asyncio.CancelledError:
-                break
-        await self.shutdown()
+                logger.info("Connecting to saltybet websocket...")
+                # Skip the long-polling handshake and upgrade.
+                await sio.connect(self.ws_url, transports=["websocket"])
+            except (SocketIOConnectionError, ClientError, OSError) as e:
+                # Only transport failures are retried, bugs propagate.
+                logger.warning("Websocket connection failed: %s", e)
+                await self._reconnect_backoff(stop, attempt)
+                return attempt + 1
+            if stop.is_set():
+                # stop() was called while connecting.
+                return None
+            logger.info("Connected, waiting for messages.")
+        try:
+            if await self._wait_or_stop(stop):
+                return None
+        except (SocketIOConnectionError, ClientError, OSError) as e:
+            logger.warning("Websocket connection lost: %s", e)
+            await self._reconnect_backoff(stop, attempt)
+            return attempt + 1
+        # A clean close isn't a failure, reconnect right away.
+        if not stop.is_set():
+            logger.info("Websocket closed by server, reconnecting.")
+        return 0
+
+    async def _reconnect_backoff(self, stop: asyncio.Event, attempt: int):
+        """Waits out the reconnect delay for attempt, returning early on stop()"""
+        # The library only retries established connections, so back off here
+        # when the initial connect fails or it gives up.
+        wait = min(
+            self.reconnect_delay_max, self.reconnect_delay * (1 << min(attempt, 30))
+        )
+        wait += wait * self.reconnect_jitter * (2 * random() - 1)
+        logger.info("Reconnecting in %.2f seconds.", wait)
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _wait_or_stop(self, stop: asyncio.Event) -> bool:
+        """Waits until sio.wait() returns or stop() is called, True if stopped"""
+        sio = self.sio
+        wait_task = asyncio.ensure_future(sio.wait())
+        stop_task = asyncio.ensure_future(stop.wait())
+        try:
+            await asyncio.wait(
+                (wait_task, stop_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not stop_task.done():
+                # Raises transport errors from wait() for run() to retry.
+                wait_task.result()
+                return False
+            await self._abort_reconnect()
+            await sio.disconnect()
+            return True
+        finally:
+            wait_task.cancel()
+            stop_task.cancel()
+            await asyncio.gather(wait_task, stop_task, return_exceptions=True)
+
+    async def _abort_reconnect(self):
+        """Ends python-socketio's own reconnect loop, if one is running"""
+        # Relies on python-socketio 4.x (pinned ^4.6) internals: the reconnect
+        # task retries forever and isn't ended by disconnect(), and cancelling
+        # it mid-delay only skips to the next attempt, so it is aborted instead.
+        sio = self.sio
+        reconnect = sio._reconnect_task  # pylint: disable=protected-access
+        if reconnect is not None:
+            sio._reconnect_abort.set()  # pylint: disable=protected-access
+            await asyncio.gather(reconnect, return_exceptions=True)
+
+    def stop(self):
+        """Asks run() to shut down, safe to use as a signal handler"""
+        # run() notices the event whether connecting, connected or reconnecting.
+        if self._stop_event is not None:
+            self._stop_event.set()
 
     async def shutdown(self):
-        if self.running:
-            # On_End Event
-            for f in self._on_end_triggers:
-                await f()
-            logger.info("Closing connections.")
-            await self.sio.disconnect()
-            await self.session.close()
-            self.running = False
-
-        # Parent shutdown()
-        await super().shutdown()
+        try:
+            if self.running:
+                # Cleared first so repeated calls don't fire on_end again.
+                self.running = False
+                try:
+                    # Let background handlers finish before on_end.
+                    if self._handler_tasks:
+                        await asyncio.gather(
+                            *self._handler_tasks, return_exceptions=True
+                        )
+                    # On_End Event
+                    await self._trigger_lifecycle("on_end")
+                finally:
+                    logger.info("Closing connections.")
+                    await self.sio.disconnect()
+        finally:
+            # Parent shutdown(), closes the HTTP session.
+            await super().shutdown()
 
     # SocketIO Connection / Event Handling
 
+    async def _queue_message(self):
+        """Queues a state refresh without blocking the websocket"""
+        try:
+            self._message_queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # A refresh is already pending and will see the latest state.
+            pass
+
+    async def _consume_messages(self):
+        while True:
+            await self._message_queue.get()
+            try:
+                await self._on_message()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error handling websocket message.")
+
     async def _on_message(self):
         """Parses state.json when indicated to do so by websocket"""
         logger.debug("Socket.io Message Received")
@@ -99,180 +308,163 @@ class WebsocketClient(BasicClient):
         # Fetch state.json
         match: Match = await self.get_state()
 
-        # Add in Illuminati Stats (ajax_get_stats.php) if available
+        # Add in Illuminati Stats (ajax_get_stats.php) if available.
+        # Fighter stats don't change mid-match, so only refetch on a new matchup.
         if await self.illuminati:
-            illum_match_stats = await self.get_match_stats()
-            if illum_match_stats:
-                match.update(illum_match_stats)
+            teams = (match["red_team_name"], match["blue_team_name"])
+            if self._match_stats is None or teams != self._match_stats_teams:
+                stats = await self.get_match_stats()
+                # The stats can still describe the previous fight, only keep
+                # them for this matchup, otherwise refetch on the next message.
+                if stats and _stats_match_teams(stats, teams):
+                    self._match_stats = stats
+                    self._match_stats_teams = teams
+                else:
+                    self._match_stats = None
+            stats = self._match_stats
+            if stats:
+                # get_match_stats() already converts types, only fighters are added.
+                match["red_fighters"] = stats["red_fighters"]
+                match["blue_fighters"] = stats["blue_fighters"]
                 self._match = match
 
         await self._trigger_events(match)
 
     # Event Triggers
+    async def _trigger_lifecycle(self, trigger: str):
+        """Fires on_start / on_end triggers, logging rather than raising errors"""
+        handlers = tuple(self._triggers[trigger])
+        if not handlers:
+            return
+        results = await asyncio.gather(*(f() for f in handlers), return_exceptions=True)
+        _log_errors(trigger, results)
+
     async def _trigger_events(self, match: Match):
         """Fires registered event triggers based on State"""
 
         # Fire Triggers
         match_status: MatchStatus = match["status"]
-        if match_status != self._last_match_status:
+        last_status = self._last_match_status
+        status_changed = match_status is not last_status
+        if status_changed:
             logger.debug(
-                f"Match status changed from {self._last_match_status}"
-                + " to {match_status.name}"
+                "Match status changed from %s to %s",
+                last_status.name,
+                match_status.name,
             )
             self._last_match_status = match_status
-            await self._trigger_status_change(match)
 
         game_mode: GameMode = match["mode"]
-        if game_mode != self._last_game_mode:
+        last_mode = self._last_game_mode
+        mode_changed = game_mode is not last_mode
+        if mode_changed:
             logger.debug(
-                f"Game mode changed from {self._last_game_mode.name} "
-                + f"to {game_mode.name}"
+                "Game mode changed from %s to %s", last_mode.name, game_mode.name
             )
             self._last_game_mode = game_mode
+
+        # State is updated first, the two trigger sets are independent.
+        if self.concurrent_handlers:
+            if status_changed:
+                self._spawn_handlers(self._trigger_status_change(match))
+            if mode_changed:
+                self._spawn_handlers(self._trigger_mode_change(game_mode))
+        elif status_changed and mode_changed:
+            await asyncio.gather(
+                self._trigger_status_change(match),
+                self._trigger_mode_change(game_mode),
+            )
+        elif status_changed:
+            await self._trigger_status_change(match)
+        elif mode_changed:
             await self._trigger_mode_change(game_mode)
 
+    def _spawn_handlers(self, dispatch: Awaitable[None]):
+        """Runs a trigger dispatch in a task tracked until it finishes"""
+        task = asyncio.ensure_future(dispatch)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    def _status_handlers(self, status: MatchStatus) -> _MatchDispatch:
+        handlers = self._status_dispatch.get(status)
+        if handlers is None:
+            trigger = _STATUS_TRIGGER.get(status)
+            handlers = (
+                *self._triggers["on_status_change"],
+                *(self._triggers[trigger] if trigger else ()),
+            )
+            self._status_dispatch[status] = handlers
+        return handlers
+
+    def _mode_handlers(self, game_mode: GameMode) -> _GameModeDispatch:
+        handlers = self._mode_dispatch.get(game_mode)
+        if handlers is None:
+            trigger = _MODE_TRIGGER.get(game_mode)
+            handlers = (
+                *self._triggers["on_mode_change"],
+                *(self._triggers[trigger] if trigger else ()),
+            )
+            self._mode_dispatch[game_mode] = handlers
+        return handlers
+
+    def _invalidate_dispatch(self):
+        self._status_dispatch.clear()
+        self._mode_dispatch.clear()
+
     async def _trigger_status_change(self, match: Match):
-        trigger_funcs: List[Callable[[Match], Awaitable[None]]] = []
-        trigger_funcs.extend(self._on_status_change_triggers)
-        if match["status"] == MatchStatus.OPEN:
-            trigger_funcs.extend(self._on_status_open_triggers)
-        elif match["status"] == MatchStatus.LOCKED:
-            trigger_funcs.extend(self._on_status_locked_triggers)
-        elif match["status"] in [
-            MatchStatus.RED_WINS,
-            MatchStatus.BLUE_WINS,
-            MatchStatus.DRAW,
-        ]:
-            trigger_funcs.extend(self._on_status_complete_triggers)
-        # Execute all async
-        await asyncio.gather(*[f(match) for f in trigger_funcs])
+        handlers = self._status_handlers(match["status"])
+        if len(handlers) == 1:
+            # Common case, no need for a gathering future.
+            try:
+                await handlers[0](match)
+            except Exception as e:  # pylint: disable=broad-except
+                _log_errors("status", (e,))
+        elif handlers:
+            # Execute all async, one failing handler doesn't stop the others.
+            results = await asyncio.gather(
+                *(f(match) for f in handlers), return_exceptions=True
+            )
+            _log_errors("status", results)
 
     async def _trigger_mode_change(self, game_mode: GameMode):
-        trigger_funcs: List[Callable[[GameMode], Awaitable[None]]] = []
-        trigger_funcs.extend(self._on_mode_change_triggers)
-        if game_mode == GameMode.TOURNAMENT:
-            trigger_funcs.extend(self._on_mode_tournament_triggers)
-        elif game_mode == GameMode.EXHIBITION:
-            trigger_funcs.extend(self._on_mode_exhibition_triggers)
-        elif game_mode == GameMode.MATCHMAKING:
-            trigger_funcs.extend(self._on_mode_matchmaking_triggers)
-        # Execute all async
-        await asyncio.gather(*[f(game_mode) for f in trigger_funcs])
+        handlers = self._mode_handlers(game_mode)
+        if len(handlers) == 1:
+            try:
+                await handlers[0](game_mode)
+            except Exception as e:  # pylint: disable=broad-except
+                _log_errors("mode", (e,))
+        elif handlers:
+            # Execute all async, one failing handler doesn't stop the others.
+            results = await asyncio.gather(
+                *(f(game_mode) for f in handlers), return_exceptions=True
+            )
+            _log_errors("mode", results)
 
     # Remove Triggers
     def remove_all_triggers(self):
-        self._on_start_triggers = []
-        self._on_end_triggers = []
-        self._on_status_change_triggers = []
-        self._on_status_open_triggers = []
-        self._on_status_locked_triggers = []
-        self._on_status_complete_triggers = []
-        self._on_mode_change_triggers = []
-        self._on_mode_tournament_triggers = []
-        self._on_mode_exhibition_triggers = []
-        self._on_mode_matchmaking_triggers = []
-
-    def remove_trigger(self, trigger: str, func: Callable[..., Awaitable[None]]):
-        if trigger == "on_start" and func in self._on_start_triggers:
-            self._on_start_triggers.remove(func)
-        elif trigger == "on_end" and func in self._on_end_triggers:
-            self._on_end_triggers.remove(func)
-        elif trigger == "on_status_change" and func in self._on_status_change_triggers:
-            self._on_status_change_triggers.remove(func)
-        elif trigger == "on_status_open" and func in self._on_status_open_triggers:
-            self._on_status_open_triggers.remove(func)
-        elif trigger == "on_status_locked" and func in self._on_status_locked_triggers:
-            self._on_status_locked_triggers.remove(func)
-        elif (
-            trigger == "on_status_complete"
-            and func in self._on_status_complete_triggers
-        ):
-            self._on_status_complete_triggers.remove(func)
-        elif trigger == "on_mode_change" and func in self._on_mode_change_triggers:
-            self._on_mode_change_triggers.remove(func)
-        elif (
-            trigger == "on_mode_tournament"
-            and func in self._on_mode_tournament_triggers
-        ):
-            self._on_mode_tournament_triggers.remove(func)
-        elif (
-            trigger == "on_mode_exhibition"
-            and func in self._on_mode_exhibition_triggers
-        ):
-            self._on_mode_exhibition_triggers.remove(func)
-        elif (
-            trigger == "on_mode_matchmaking"
-            and func in self._on_mode_matchmaking_triggers
-        ):
-            self._on_mode_matchmaking_triggers.remove(func)
-
-    # Add Triggers / Event Decorators
-    def on_start(
-        self, func: Callable[[], Awaitable[None]]
-    ) -> Callable[[], Awaitable[None]]:
-        if func not in self._on_start_triggers:
-            self._on_start_triggers.append(func)
-        return func
+        for handlers in self._triggers.values():
+            handlers.clear()
+        self._invalidate_dispatch()
 
-    def on_end(
-        self, func: Callable[[], Awaitable[None]]
-    ) -> Callable[[], Awaitable[None]]:
-        if func not in self._on_end_triggers:
-            self._on_end_triggers.append(func)
-        return func
-
-    def on_status_change(
-        self, func: Callable[[Match], Awaitable[None]]
-    ) -> Callable[[Match], Awaitable[None]]:
-        if func not in self._on_status_change_triggers:
-            self._on_status_change_triggers.append(func)
-        return func
-
-    def on_status_open(
-        self, func: Callable[[Match], Awaitable[None]]
-    ) -> Callable[[Match], Awaitable[None]]:
-        if func not in self._on_status_open_triggers:
-            self._on_status_open_triggers.append(func)
-        return func
+    def remove_trigger(self, trigger: str, func: _Trigger):
+        handlers = self._triggers.get(trigger)
+        if handlers is not None:
+            handlers.pop(func, None)
+            self._invalidate_dispatch()
 
-    def on_status_locked(
-        self, func: Callable[[Match], Awaitable[None]]
-    ) -> Callable[[Match], Awaitable[None]]:
-        if func not in self._on_status_locked_triggers:
-            self._on_status_locked_triggers.append(func)
-        return func
-
-    def on_status_complete(
-        self, func: Callable[[Match], Awaitable[None]]
-    ) -> Callable[[Match], Awaitable[None]]:
-        if func not in self._on_status_complete_triggers:
-            self._on_status_complete_triggers.append(func)
-        return func
-
-    def on_mode_change(
-        self, func: Callable[[GameMode], Awaitable[None]]
-    ) -> Callable[[GameMode], Awaitable[None]]:
-        if func not in self._on_mode_change_triggers:
-            self._on_mode_change_triggers.append(func)
-        return func
-
-    def on_mode_tournament(
-        self, func: Callable[[GameMode], Awaitable[None]]
-    ) -> Callable[[GameMode], Awaitable[None]]:
-        if func not in self._on_mode_tournament_triggers:
-            self._on_mode_tournament_triggers.append(func)
-        return func
-
-    def on_mode_exhibition(
-        self, func: Callable[[GameMode], Awaitable[None]]
-    ) -> Callable[[GameMode], Awaitable[None]]:
-        if func not in self._on_mode_exhibition_triggers:
-            self._on_mode_exhibition_triggers.append(func)
+    # Add Triggers / Event Decorators
+    def _add_trigger(self, trigger: str, func: _Trigger) -> _Trigger:
+        self._triggers[trigger][func] = None
+        self._invalidate_dispatch()
         return func
 
-    def on_mode_matchmaking(
-        self, func: Callable[[GameMode], Awaitable[None]]
-    ) -> Callable[[GameMode], Awaitable[None]]:
-        if func not in self._on_mode_matchmaking_triggers:
-            self._on_mode_matchmaking_triggers.append(func)
-        return func
+    on_start = partialmethod(_add_trigger, "on_start")
+    on_end = partialmethod(_add_trigger, "on_end")
+    on_status_change = partialmethod(_add_trigger, "on_status_change")
+    on_status_open = partialmethod(_add_trigger, "on_status_open")
+    on_status_locked = partialmethod(_add_trigger, "on_status_locked")
+    on_status_complete = partialmethod(_add_trigger, "on_status_complete")
+    on_mode_change = partialmethod(_add_trigger, "on_mode_change")
+    on_mode_tournament = partialmethod(_add_trigger, "on_mode_tournament")
+    on_mode_exhibition = partialmethod(_add_trigger, "on_mode_exhibition")
+    on_mode_matchmaking = partialmethod(_add_trigger, "on_mode_matchmaking")
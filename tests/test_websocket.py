@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from saltybet_asyncio.types import GameMode, Match, MatchStatus
+from saltybet_asyncio.websocket import WebsocketClient
+
+
+class _StatsClient(WebsocketClient):
+    """Feeds fixed state.json / ajax_get_stats.php results to _on_message()"""
+
+    def __init__(self, state: Match, stats: Match):
+        super().__init__()
+        self.state = state
+        self.stats = stats
+        self.stats_fetches = 0
+        self.matches = []
+
+    @property
+    async def illuminati(self) -> bool:
+        return True
+
+    async def get_state(self) -> Match:
+        return dict(self.state)
+
+    async def get_match_stats(self) -> Match:
+        self.stats_fetches += 1
+        return self.stats
+
+    async def _trigger_events(self, match: Match):
+        self.matches.append(match)
+
+
+def _state(red_team_name: str, blue_team_name: str) -> Match:
+    return {
+        "status": MatchStatus.OPEN,
+        "mode": GameMode.EXHIBITION,
+        "red_team_name": red_team_name,
+        "blue_team_name": blue_team_name,
+        "red_fighters": [],
+        "blue_fighters": [],
+    }
+
+
+def _stats(red_names, blue_names) -> Match:
+    return {
+        "red_fighters": [{"name": name} for name in red_names],
+        "blue_fighters": [{"name": name} for name in blue_names],
+    }
+
+
+class MatchStatsTest(unittest.IsolatedAsyncioTestCase):
+    async def test_single_fighters_cached(self):
+        client = _StatsClient(_state("Ryu", "Ken"), _stats(["Ryu"], ["Ken"]))
+        for _ in range(3):
+            await client._on_message()
+        self.assertEqual(client.stats_fetches, 1)
+        self.assertEqual(client.matches[-1]["red_fighters"], [{"name": "Ryu"}])
+        self.assertEqual(client.matches[-1]["blue_fighters"], [{"name": "Ken"}])
+
+    async def test_team_match_cached(self):
+        client = _StatsClient(
+            _state("Team Shoto", "Team Grappler"),
+            _stats(["Ryu", "Ken"], ["Zangief", "Hugo"]),
+        )
+        for _ in range(3):
+            await client._on_message()
+        self.assertEqual(client.stats_fetches, 1)
+        self.assertEqual(
+            client.matches[-1]["red_fighters"], [{"name": "Ryu"}, {"name": "Ken"}]
+        )
+        self.assertEqual(
+            client.matches[-1]["blue_fighters"],
+            [{"name": "Zangief"}, {"name": "Hugo"}],
+        )
+
+    async def test_previous_fight_not_cached(self):
+        client = _StatsClient(_state("Ryu", "Ken"), _stats(["Guile"], ["Blanka"]))
+        await client._on_message()
+        self.assertEqual(client.matches[-1]["red_fighters"], [])
+        # The stats endpoint caught up, the next message picks them up.
+        client.stats = _stats(["Ryu"], ["Ken"])
+        await client._on_message()
+        await client._on_message()
+        self.assertEqual(client.stats_fetches, 2)
+        self.assertEqual(client.matches[-1]["red_fighters"], [{"name": "Ryu"}])
+
+
+if __name__ == "__main__":
+    unittest.main()